@@ -103,6 +103,11 @@ async def match_resource_daemons(
         for daemon_id, daemon in daemons.items()
         if daemon_id not in matching_daemon_ids
     }
+
+    # Usually, all the running daemons still match: this is re-checked on every event.
+    if not mismatching_daemons:
+        return []
+
     delays = await stop_resource_daemons(
         settings=settings,
         daemons=mismatching_daemons,
@@ -231,6 +236,7 @@ async def daemon_killer(
     coros = [
         stop_daemon(daemon_id=daemon_id, daemon=daemon)
         for memory in memories.iter_all_memories()
+        if memory.daemons is not None
         for daemon_id, daemon in memory.daemons.items()
     ]
     if coros:
@@ -312,7 +318,7 @@ async def _runner(
         # Prevent future re-spawns for those exited on their own, for no reason.
         # Only the filter-mismatching daemons can be re-spawned on future events.
         if cause.stopper.reason == primitives.DaemonStoppingReason.NONE:
-            memory.forever_stopped.add(handler.id)
+            memory.ensure_forever_stopped().add(handler.id)
 
         # Save the memory by not remembering the exited daemons (they may be never re-spawned).
         del daemons[containers.DaemonId(handler.id)]
@@ -65,11 +65,11 @@ async def process_resource_event(
     # Recall what is stored about that object. Share it in little portions with the consumers.
     # And immediately forget it if the object is deleted from the cluster (but keep in memory).
     raw_type, raw_body = raw_event['type'], raw_event['object']
-    memory = await memories.recall(raw_body, noticed_by_listing=raw_type is None)
+    memory = memories.recall(raw_body, noticed_by_listing=raw_type is None)
     if memory.live_fresh_body is not None:
         memory.live_fresh_body._replace_with(raw_body)
     if raw_type == 'DELETED':
-        await memories.forget(raw_body)
+        memories.forget(raw_body)
 
     # Convert to a heavy mapping-view wrapper only now, when heavy processing begins.
     # Raw-event streaming, queueing, and batching use regular lightweight dicts.
@@ -134,7 +134,7 @@ async def process_resource_event(
         (resource_spawning_cause is not None and
          registry.resource_spawning_handlers[resource].requires_finalizer(
              cause=resource_spawning_cause,
-             excluded=memory.forever_stopped,
+             excluded=memory.forever_stopped or frozenset(),
          ))
         or
         (resource_changing_cause is not None and
@@ -318,25 +318,26 @@ async def process_resource_spawning_cause(
     if finalizers.is_deletion_ongoing(cause.body):
         stopping_delays = await daemons.stop_resource_daemons(
             settings=settings,
-            daemons=memory.daemons,
+            daemons=memory.daemons or {},
         )
         return stopping_delays
 
     else:
         handlers = registry.resource_spawning_handlers[cause.resource].get_handlers(
             cause=cause,
-            excluded=memory.forever_stopped,
+            excluded=memory.forever_stopped or frozenset(),
         )
+        # Only allocate the daemons' container if there is anything to spawn (not on mismatches).
         spawning_delays = await daemons.spawn_resource_daemons(
             settings=settings,
-            daemons=memory.daemons,
+            daemons=memory.ensure_daemons() if handlers else memory.daemons or {},
             cause=cause,
             memory=memory,
             handlers=handlers,
         )
         matching_delays = await daemons.match_resource_daemons(
             settings=settings,
-            daemons=memory.daemons,
+            daemons=memory.daemons or {},
             handlers=handlers,
         )
         return list(spawning_delays) + list(matching_delays)
@@ -8,10 +8,9 @@ It is used internally to track allocated system resources for each Kubernetes
 object, even if that object does not show up in the event streams for long time.
 """
 import asyncio
-import dataclasses
 import logging
 import time
-from typing import MutableMapping, Dict, Set, Any, Iterator, Optional, Union, NewType, TYPE_CHECKING
+from typing import Dict, Set, Any, Iterator, Optional, Union, NewType, TYPE_CHECKING
 
 from kopf.structs import bodies
 from kopf.structs import handlers
@@ -27,14 +26,37 @@ else:
 
 DaemonId = NewType('DaemonId', str)
 
+# The key of the resources without uids (e.g. synthetic events): all such events share one memory.
+_EMPTY_KEY = ''
+
+# A marker for absent keys, distinguishable from any user-stored value (including None).
+_MISSING = object()
+
+# Pre-bound for the attribute access in memos, which happens on every handler invocation.
+_dict_get = dict.get
+_dict_pop = dict.pop
+
 
-@dataclasses.dataclass(frozen=True)
 class Daemon:
+    __slots__ = ('task', 'logger', 'handler', 'stopper')
     task: asyncio_Task  # a guarding task of the daemon.
     logger: Union[logging.Logger, logging.LoggerAdapter]
     handler: handlers.ResourceSpawningHandler
     stopper: primitives.DaemonStopper  # a signaller for the termination and its reason.
 
+    def __init__(
+            self,
+            task: asyncio_Task,
+            logger: Union[logging.Logger, logging.LoggerAdapter],
+            handler: handlers.ResourceSpawningHandler,
+            stopper: primitives.DaemonStopper,
+    ) -> None:
+        super().__init__()
+        self.task = task
+        self.logger = logger
+        self.handler = handler
+        self.stopper = stopper
+
 
 class Memo(Dict[Any, Any]):
     """ A container to hold arbitrary keys-fields assigned by the users. """
@@ -43,34 +65,68 @@ class Memo(Dict[Any, Any]):
         self[key] = value
 
     def __delattr__(self, key: str) -> None:
-        try:
-            del self[key]
-        except KeyError as e:
-            raise AttributeError(str(e))
+        if _dict_pop(self, key, _MISSING) is _MISSING:
+            raise AttributeError(key)
 
     def __getattr__(self, key: str) -> Any:
-        try:
-            return self[key]
-        except KeyError as e:
-            raise AttributeError(str(e))
+        value = _dict_get(self, key, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(key)
+        return value
 
 
-@dataclasses.dataclass(frozen=False)
 class ResourceMemory:
     """ A system memo about a single resource/object. Usually stored in `Memories`. """
 
+    # There can be thousands of resources, so keep the per-resource memories compact.
+    __slots__ = (
+        'memo',
+        'noticed_by_listing',
+        'fully_handled_once',
+        'live_fresh_body',
+        'idle_reset_time',
+        'forever_stopped',
+        'daemons',
+    )
+
     # For arbitrary user data to be stored in memory, passed as `memo` to all the handlers.
-    memo: Memo = dataclasses.field(default_factory=Memo)
+    memo: Memo
 
     # For resuming handlers tracking and deciding on should they be called or not.
-    noticed_by_listing: bool = False
-    fully_handled_once: bool = False
+    noticed_by_listing: bool
+    fully_handled_once: bool
 
     # For background and timed threads/tasks (invoked with the kwargs of the last-seen body).
-    live_fresh_body: Optional[bodies.Body] = None
-    idle_reset_time: float = dataclasses.field(default_factory=time.monotonic)
-    forever_stopped: Set[handlers.HandlerId] = dataclasses.field(default_factory=set)
-    daemons: Dict[DaemonId, Daemon] = dataclasses.field(default_factory=dict)
+    live_fresh_body: Optional[bodies.Body]
+    idle_reset_time: float
+
+    # Most resources never have daemons or stopped handlers, so these are created on demand.
+    forever_stopped: Optional[Set[handlers.HandlerId]]
+    daemons: Optional[Dict[DaemonId, Daemon]]
+
+    def __init__(
+            self,
+            *,
+            noticed_by_listing: bool = False,
+    ) -> None:
+        super().__init__()
+        self.memo = Memo()
+        self.noticed_by_listing = noticed_by_listing
+        self.fully_handled_once = False
+        self.live_fresh_body = None
+        self.idle_reset_time = time.monotonic()
+        self.forever_stopped = None
+        self.daemons = None
+
+    def ensure_forever_stopped(self) -> Set[handlers.HandlerId]:
+        if self.forever_stopped is None:
+            self.forever_stopped = set()
+        return self.forever_stopped
+
+    def ensure_daemons(self) -> Dict[DaemonId, Daemon]:
+        if self.daemons is None:
+            self.daemons = {}
+        return self.daemons
 
 
 class ResourceMemories:
@@ -91,17 +147,21 @@ class ResourceMemories:
     are handled in parallel through), so the same key will not be added/deleted
     in the background during the operation, so the locking is not needed.
     """
-    _items: MutableMapping[str, ResourceMemory]
+    _items: Dict[str, ResourceMemory]
 
     def __init__(self) -> None:
         super().__init__()
         self._items = {}
 
+        # Pre-bound for the lookups on every watch-event. The container is never replaced.
+        self._get = self._items.get
+        self._set = self._items.__setitem__
+        self._pop = self._items.pop
+
     def iter_all_memories(self) -> Iterator[ResourceMemory]:
-        for memory in self._items.values():
-            yield memory
+        return iter(self._items.values())
 
-    async def recall(
+    def recall(
             self,
             raw_body: bodies.RawBody,
             *,
@@ -113,24 +173,23 @@ class ResourceMemories:
         Keep the last-seen body up to date for all the handlers.
         """
         key = self._build_key(raw_body)
-        if key not in self._items:
+        memory = self._get(key)
+        if memory is None:
             memory = ResourceMemory(noticed_by_listing=noticed_by_listing)
-            self._items[key] = memory
-        return self._items[key]
+            self._set(key, memory)
+        return memory
 
-    async def forget(
+    def forget(
             self,
             raw_body: bodies.RawBody,
     ) -> None:
         """
         Forget the resource's memory if it exists; or ignore if it does not.
         """
-        key = self._build_key(raw_body)
-        if key in self._items:
-            del self._items[key]
+        self._pop(self._build_key(raw_body), None)
 
+    @staticmethod
     def _build_key(
-            self,
             raw_body: bodies.RawBody,
     ) -> str:
         """
@@ -142,4 +201,9 @@ class ResourceMemories:
 
         But it must be consistent within a single process lifetime.
         """
-        return raw_body.get('metadata', {}).get('uid') or ''
+        metadata = raw_body.get('metadata')
+        if metadata is not None:
+            uid = metadata.get('uid')
+            if uid:
+                return uid
+        return _EMPTY_KEY
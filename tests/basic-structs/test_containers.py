@@ -1,4 +1,5 @@
 import collections.abc
+import copy
 
 import pytest
 
@@ -16,32 +17,64 @@ def test_creation_with_defaults():
     ResourceMemory()
 
 
-async def test_recalling_creates_when_absent():
+def test_rarely_used_fields_are_not_allocated_by_default():
+    memory = ResourceMemory()
+    assert memory.daemons is None
+    assert memory.forever_stopped is None
+
+
+def test_rarely_used_fields_are_allocated_on_demand():
+    memory = ResourceMemory()
+    daemons = memory.ensure_daemons()
+    forever_stopped = memory.ensure_forever_stopped()
+    assert daemons == {}
+    assert forever_stopped == set()
+    assert memory.daemons is daemons
+    assert memory.forever_stopped is forever_stopped
+    assert memory.ensure_daemons() is daemons
+    assert memory.ensure_forever_stopped() is forever_stopped
+
+
+def test_recalling_creates_when_absent():
     memories = ResourceMemories()
-    memory = await memories.recall(BODY)
+    memory = memories.recall(BODY)
     assert isinstance(memory, ResourceMemory)
 
 
-async def test_recalling_reuses_when_present():
+def test_recalling_reuses_when_present():
+    memories = ResourceMemories()
+    memory1 = memories.recall(BODY)
+    memory2 = memories.recall(BODY)
+    assert memory1 is memory2
+
+
+@pytest.mark.parametrize('body', [
+    pytest.param({}, id='no-metadata'),
+    pytest.param({'metadata': {}}, id='no-uid'),
+    pytest.param({'metadata': {'uid': None}}, id='none-uid'),
+    pytest.param({'metadata': {'uid': ''}}, id='empty-uid'),
+    pytest.param({'metadata': None}, id='none-metadata'),
+])
+def test_recalling_shares_memory_for_bodies_without_uids(body):
     memories = ResourceMemories()
-    memory1 = await memories.recall(BODY)
-    memory2 = await memories.recall(BODY)
+    memory1 = memories.recall(body)
+    memory2 = memories.recall({})
     assert memory1 is memory2
 
 
-async def test_forgetting_deletes_when_present():
+def test_forgetting_deletes_when_present():
     memories = ResourceMemories()
-    memory1 = await memories.recall(BODY)
-    await memories.forget(BODY)
+    memory1 = memories.recall(BODY)
+    memories.forget(BODY)
 
     # Check by recalling -- it should be a new one.
-    memory2 = await memories.recall(BODY)
+    memory2 = memories.recall(BODY)
     assert memory1 is not memory2
 
 
-async def test_forgetting_ignores_when_absent():
+def test_forgetting_ignores_when_absent():
     memories = ResourceMemories()
-    await memories.forget(BODY)
+    memories.forget(BODY)
 
 
 def test_object_dict_creation():
@@ -75,6 +108,28 @@ def test_object_dict_fields_deleted():
     assert obj == {}
 
 
+@pytest.mark.parametrize('fn', [copy.copy, copy.deepcopy])
+def test_object_dict_copies_keep_fields_as_keys(fn):
+    obj = Memo()
+    obj.xyz = 100
+    new_obj = fn(obj)
+    new_obj.abc = 200
+    assert new_obj['xyz'] == 100
+    assert new_obj['abc'] == 200
+    assert obj == {'xyz': 100}
+
+
+@pytest.mark.parametrize('key', ['items', 'get', 'keys', 'update'])
+def test_object_dict_keys_do_not_hide_methods(key):
+    obj = Memo()
+    obj[key] = 100
+    setattr(obj, key, 200)
+    assert obj[key] == 200
+    assert callable(getattr(obj, key))
+    assert list(obj.items()) == [(key, 200)]
+    assert obj.get(key) == 200
+
+
 def test_object_dict_raises_key_errors_on_get():
     obj = Memo()
     with pytest.raises(KeyError):
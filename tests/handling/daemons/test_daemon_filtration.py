@@ -61,3 +61,23 @@ async def test_daemon_filtration_mismatched(
 
     assert spawn_resource_daemons.called
     assert spawn_resource_daemons.call_args_list[0][1]['handlers'] == []
+
+
+async def test_daemon_filtration_mismatched_allocates_nothing(
+        registry, settings, resource, memories,
+        caplog, assert_logs, k8s_mocked, simulate_cycle):
+    caplog.set_level(logging.DEBUG)
+
+    @kopf.daemon(resource.group, resource.version, resource.plural, registry=registry, id='fn',
+                 labels={'a': 'value'})
+    async def fn(**kwargs):
+        pass
+
+    finalizer = settings.persistence.finalizer
+    event_body = {'metadata': {'labels': {'a': 'mismatching-value'},
+                               'finalizers': [finalizer]}}
+    await simulate_cycle(event_body)
+
+    memory = memories.recall(event_body)
+    assert memory.daemons is None
+    assert memory.forever_stopped is None
@@ -1,6 +1,9 @@
 import logging
+import unittest.mock
 
 import kopf
+from kopf.reactor.daemons import match_resource_daemons
+from kopf.structs.containers import DaemonId
 from kopf.structs.primitives import DaemonStoppingReason
 
 
@@ -34,3 +37,37 @@ async def test_running_daemon_is_stopped_when_mismatches(
     assert timer.seconds < 0.01  # near-instantly
     stopped = dummy.kwargs['stopped']
     assert DaemonStoppingReason.FILTERS_MISMATCH in stopped.reason
+
+
+async def test_matching_daemons_are_not_stopped(settings, mocker):
+    stop_resource_daemons = mocker.patch('kopf.reactor.daemons.stop_resource_daemons')
+    handler = unittest.mock.Mock(id='fn')
+    daemon = unittest.mock.Mock()
+
+    delays = await match_resource_daemons(
+        settings=settings,
+        handlers=[handler],
+        daemons={DaemonId('fn'): daemon},
+    )
+
+    assert delays == []
+    assert not stop_resource_daemons.called
+
+
+async def test_mismatching_daemons_are_stopped(settings, mocker):
+    stop_resource_daemons = mocker.patch('kopf.reactor.daemons.stop_resource_daemons',
+                                         return_value=[1.0])
+    handler = unittest.mock.Mock(id='fn')
+    daemon1 = unittest.mock.Mock()
+    daemon2 = unittest.mock.Mock()
+
+    delays = await match_resource_daemons(
+        settings=settings,
+        handlers=[handler],
+        daemons={DaemonId('fn'): daemon1, DaemonId('other'): daemon2},
+    )
+
+    assert delays == [1.0]
+    assert stop_resource_daemons.call_count == 1
+    assert stop_resource_daemons.call_args[1]['daemons'] == {DaemonId('other'): daemon2}
+    assert stop_resource_daemons.call_args[1]['reason'] == DaemonStoppingReason.FILTERS_MISMATCH
@@ -42,3 +42,24 @@ async def test_daemon_initial_delay_obeyed(
     assert k8s_mocked.sleep_or_wait.call_count >= 1
     assert k8s_mocked.sleep_or_wait.call_count <= 2  # one optional extra call for sleep(None)
     assert k8s_mocked.sleep_or_wait.call_args_list[0][0][0] == 1.0  # [call#][args/kwargs][arg#]
+
+
+async def test_daemon_exited_on_its_own_is_stopped_forever(
+        registry, resource, dummy, memories,
+        caplog, assert_logs, k8s_mocked, simulate_cycle):
+    caplog.set_level(logging.DEBUG)
+
+    @kopf.daemon(resource.group, resource.version, resource.plural, registry=registry, id='fn')
+    async def fn(**kwargs):
+        dummy.kwargs = kwargs
+        dummy.steps['called'].set()
+
+    event_body = {}
+    await simulate_cycle(event_body)
+
+    await dummy.steps['called'].wait()
+    await dummy.wait_for_daemon_done()
+
+    memory = memories.recall(event_body)
+    assert memory.daemons == {}  # self-garbage-collected on exit
+    assert memory.forever_stopped == {'fn'}